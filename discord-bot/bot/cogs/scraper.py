@@ -7,9 +7,9 @@ rule PDFs under the "Ruleset and Resources" section. When changes are detected,
 announces them in a designated Discord channel with proper role mentions.
 
 Main Features:
-- Automated scraping using Playwright and BeautifulSoup
+- Automated scraping using aiohttp and lxml, with a Playwright fallback
 - Change detection using cached JSON data (fsae_pdfs.json)
-- Fetches metadata via HTTP HEAD requests
+- Fetches metadata via HTTP HEAD requests, falling back to ranged GET requests
 - Sends formatted announcements to a designated discord channel with role tagging
 """
 
@@ -18,10 +18,12 @@ import os
 import json
 import logging
 import discord
+from email.message import Message
 from discord.ext import commands, tasks
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
+from lxml import etree
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 import aiohttp
 from pathlib import Path
 
@@ -31,16 +33,99 @@ logger = logging.getLogger(__name__)
 ROOT_DIR = Path(__file__).resolve().parents[2]
 DATA_FILE = ROOT_DIR / "fsae_pdfs.json"
 
+# Page listing all FSAE documents, including the "Ruleset and Resources" folder
+DOCUMENTS_URL = "https://www.fsaeonline.com/cdsweb/gen/DocumentResources.aspx"
+
+# Resource types the headless browser skips when rendering the documents page
+BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media"}
+
+# Row the headless browser waits for before reading the page, and how long it waits (ms)
+RULESET_ROW_SELECTOR = "tr[data-folder-id='Ruleset and Resources']"
+RENDER_TIMEOUT_MS = 15000
+
+# Maximum number of simultaneous metadata requests to the FSAE site
+MAX_CONCURRENT_REQUESTS = 16
+
+# Every this many checks, filenames are re-requested for all PDFs to catch files replaced behind an unchanged URL
+METADATA_RECHECK_CHECKS = 4
+
+# Polling schedule: check slowly by default, then briefly speed up after a change is detected
+POLL_INTERVAL_MINUTES = 15
+FAST_POLL_INTERVAL_MINUTES = 2
+FAST_POLL_CHECKS = 5
+
+# Size of each piece of HTML fed to the parser, so parsing can stop once the ruleset folder ends
+PARSE_CHUNK_SIZE = 16 * 1024
+
+# Compiled XPath lookups for rows in the "Ruleset and Resources" table
+TITLE_XPATH = etree.XPath("string(td[1]/text()[1])", smart_strings=False)
+DESCRIPTION_XPATH = etree.XPath("(td[1]//span)[1]//text()", smart_strings=False)
+DOWNLOAD_XPATH = etree.XPath(
+    "(.//a[contains(concat(' ', normalize-space(@class), ' '), ' btn-primary ')])[1]/@href",
+    smart_strings=False,
+)
+
+# Discord message and embed size limits (characters), with headroom below the 2000 char message cap
+MESSAGE_CHUNK_LIMIT = 1900
+EMBED_FIELD_LIMIT = 1024
+EMBED_TOTAL_LIMIT = 6000
+
 class ScraperCog(commands.Cog):
     """Cog that handles automated scraping and Discord announcements for FSAE ruleset updates."""
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._session = None
+        self._playwright = None
+        self._browser = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # Reads announcement settings once; the channel itself is resolved on first use
+        self.channel_id = int(os.getenv("CHANNEL_ID") or 0)
+        self.role_id = int(os.getenv("ROLE_ID") or 0)
+        self._announce = bool(self.channel_id and self.role_id)
+        if not self._announce:
+            logger.warning("CHANNEL_ID or ROLE_ID not set in env file. Skipping announcements.")
+        self._channel = None
+
+        # In-memory copy of the cache and its lookup indexes, rebuilt only when the cache changes
+        self._previous_pdfs = None
+        self._indexed_pdfs = None
+        self._previous_urls = {}
+        self._previous_titles = {}
+
+        # Checks left until filenames of already cached PDFs are requested again
+        self._checks_until_recheck = 0
+
+        # Number of upcoming checks that still run on the fast polling interval
+        self._fast_checks_remaining = 0
+
         self.check_for_updates.start()
+
+    async def cog_load(self):
+        """Opens a shared HTTP session so keep-alive connections are reused between checks."""
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS, keepalive_timeout=75)
+        )
+
+    async def cog_unload(self):
+        """Stops the periodic check and closes the shared HTTP session and browser."""
+        self.check_for_updates.cancel()
+        if self._session:
+            await self._session.close()
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
     
     def save_data(self, data):
-        """Save the current list of PDFs to the local JSON cache file."""
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        """
+        Save the current list of PDFs to the local JSON cache file.
+        Writes to a temporary file first so a crash mid-write can't truncate the cache.
+        """
+        temp_file = DATA_FILE.with_suffix(".json.tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_file, DATA_FILE)
 
     def load_data(self):
         """Load the most recently saved list of PDFs, or return an empty list if none exists."""
@@ -50,38 +135,189 @@ class ScraperCog(commands.Cog):
         except FileNotFoundError:
             return []
     
+    async def fetch_disposition(self, url: str, session: aiohttp.ClientSession):
+        """
+        Return the Content-Disposition header for a PDF, or None if the server doesn't send one.
+        Tries a HEAD request first, then a one-byte ranged GET for handlers that reject HEAD.
+        """
+        async with session.head(url) as response:
+            disposition = response.headers.get("Content-Disposition")
+            if response.status < 400 and disposition:
+                return disposition
+
+        async with session.get(url, headers={"Range": "bytes=0-0"}) as response:
+            response.raise_for_status()
+            return response.headers.get("Content-Disposition")
+
+    def document_id_from_url(self, url: str):
+        """Return the DocumentID query parameter of a URL, or None if it has none."""
+        return parse_qs(urlsplit(url).query).get("DocumentID", [None])[0]
+
+    def filename_from_url(self, url: str):
+        """Build a stable fallback filename from the URL's DocumentID and last path segment."""
+        doc_id = self.document_id_from_url(url)
+        segment = urlsplit(url).path.rsplit("/", 1)[-1]
+        return "_".join(part for part in (doc_id, segment) if part) or None
+
     async def get_metadata(self, url: str, session: aiohttp.ClientSession):
         """
-        Fetch metadata for a given PDF via a HEAD request.
+        Fetch metadata for a given PDF.
         Used mainly to obtain the filename from Content-Disposition headers.
         """
         try:
-            async with session.head(url) as response:
-                filename = None
-                disposition = response.headers.get("Content-Disposition")
-                if disposition:
-                    for part in disposition.split(';'):
-                        if part.strip().startswith('filename='):
-                            filename = part.split('=')[1].strip()
-                return {"filename": filename}
+            async with self._semaphore:
+                disposition = await self.fetch_disposition(url, session)
         except Exception as e:
             logger.error(f"Could not fetch metadata for {url}: {e}", exc_info=True)
-            return {"filename": None}
+            return {"filename": None, "failed": True}
+
+        filename = None
+        if disposition:
+            # Lets the stdlib header parser handle quoting and RFC 5987 encoded filenames
+            message = Message()
+            message["Content-Disposition"] = disposition
+            filename = message.get_filename()
+        return {"filename": filename}
+
+    def normalize_filename(self, filename):
+        """
+        Strip the quotes that older caches kept around filenames,
+        so they compare equal to the unquoted names the header parser returns.
+        """
+        return filename.strip().strip('"') if filename else filename
+
+    def get_channel(self):
+        """Return the announcement channel, resolving and caching it on first use."""
+        if self._channel is None:
+            self._channel = self.bot.get_channel(self.channel_id)
+        return self._channel
+
+    def index_previous(self, previous_pdfs):
+        """Return (url, title) lookups for the previous PDFs, reusing them while the list is unchanged."""
+        if self._indexed_pdfs is not previous_pdfs:
+            self._previous_urls = {pdf['url']: pdf for pdf in previous_pdfs}
+            self._previous_titles = {pdf['title']: pdf for pdf in previous_pdfs}
+            self._indexed_pdfs = previous_pdfs
+        return self._previous_urls, self._previous_titles
+
+    def build_embed(self, new_pdfs, modified_pdfs):
+        """
+        Build a single embed listing new and updated PDFs.
+        Returns None if the content would exceed Discord's embed limits.
+        """
+        embed = discord.Embed(title="FSAE Ruleset Updates", color=discord.Color.gold())
+        for name, pdfs in (("New FSAE Rules Posted", new_pdfs), ("FSAE Rules Have Been Updated", modified_pdfs)):
+            if not pdfs:
+                continue
+            value = "\n".join(f"[{pdf['title']}]({pdf['url']})" for pdf in pdfs)
+            if len(value) > EMBED_FIELD_LIMIT:
+                return None
+            embed.add_field(name=name, value=value, inline=False)
+
+        if len(embed) > EMBED_TOTAL_LIMIT:
+            return None
+        return embed
+
+    def chunk_message(self, message_parts):
+        """Join message lines into chunks that each fit within Discord's message length limit."""
+        chunks = []
+        current = ""
+        for part in message_parts:
+            if current and len(current) + 1 + len(part) > MESSAGE_CHUNK_LIMIT:
+                chunks.append(current)
+                current = part
+            else:
+                current = f"{current}\n{part}" if current else part
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def announce(self, channel, new_pdfs, modified_pdfs):
+        """Announce new and modified PDFs in one embed, falling back to plain messages if it won't fit."""
+        # Only the configured role may be pinged, regardless of what the message contains
+        role_mention = discord.AllowedMentions(everyone=False, users=False, roles=[discord.Object(self.role_id)])
+        embed = self.build_embed(new_pdfs, modified_pdfs)
+        if embed is not None:
+            await channel.send(content=f"<@&{self.role_id}>", embed=embed, allowed_mentions=role_mention)
+            return
+
+        message_parts = []
+        if new_pdfs:
+            message_parts.append("**New FSAE Rules Posted:**\n")
+            for pdf in new_pdfs:
+                message_parts.append(f"> **{pdf['title']}:**\n> {pdf['url']}")
+
+        if modified_pdfs:
+            message_parts.append("**FSAE Rules Have Been Updated:**\n")
+            for pdf in modified_pdfs:
+                message_parts.append(f"> **{pdf['title']}:** **(Updated)**\n> {pdf['url']}")
+
+        # Mentions the role once, in the first chunk only
+        message_parts[0] = f"<@&{self.role_id}> {message_parts[0]}"
+        for chunk in self.chunk_message(message_parts):
+            await channel.send(chunk, allowed_mentions=role_mention)
+
+    def adjust_interval(self, changed):
+        """Switch to fast polling after a change, and back to the normal interval once it settles."""
+        if changed:
+            if not self._fast_checks_remaining:
+                self.check_for_updates.change_interval(minutes=FAST_POLL_INTERVAL_MINUTES)
+            self._fast_checks_remaining = FAST_POLL_CHECKS
+        elif self._fast_checks_remaining:
+            self._fast_checks_remaining -= 1
+            if not self._fast_checks_remaining:
+                self.check_for_updates.change_interval(minutes=POLL_INTERVAL_MINUTES)
 
-    @tasks.loop(seconds=20)
+    @tasks.loop(minutes=POLL_INTERVAL_MINUTES)
     async def check_for_updates(self):
         """Periodically scrapes the site, compares results, and announces any new or modified PDFs."""
-        previous_pdfs = self.load_data()
-        current_pdfs = await self.scrape_pdfs()
+        # Only reads the cache from disk on the first check; File I/O runs in a worker thread
+        if self._previous_pdfs is None:
+            self._previous_pdfs = await asyncio.to_thread(self.load_data)
+        previous_pdfs = self._previous_pdfs
 
-        # Attach filenames via metadata requests
-        async with aiohttp.ClientSession() as session:
-            for pdf in current_pdfs:
-                metadata = await self.get_metadata(pdf['url'], session)
-                pdf['filename'] = metadata.get('filename')
+        # A failed or empty scrape keeps the existing cache instead of overwriting it,
+        # and counts as an unchanged check so an outage doesn't hold the fast polling interval
+        try:
+            current_pdfs = await self.scrape_pdfs()
+        except Exception:
+            logger.error("Failed to scrape FSAE documents page", exc_info=True)
+            self.adjust_interval(False)
+            return
+        if not current_pdfs:
+            self.adjust_interval(False)
+            return
+
+        previous_urls, previous_titles = self.index_previous(previous_pdfs)
+
+        # Reuses cached filenames for known URLs, except on periodic rechecks
+        recheck = self._checks_until_recheck == 0
+        self._checks_until_recheck = (self._checks_until_recheck - 1) % METADATA_RECHECK_CHECKS
+        uncached_pdfs = []
+        for pdf in current_pdfs:
+            cached_pdf = previous_urls.get(pdf['url'])
+            if cached_pdf and cached_pdf.get('filename') and not recheck:
+                pdf['filename'] = cached_pdf['filename']
+                continue
+            uncached_pdfs.append(pdf)
 
-        previous_urls = {pdf['url']: pdf for pdf in previous_pdfs}
-        previous_titles = {pdf['title']: pdf for pdf in previous_pdfs}
+        # Attach filenames via concurrent metadata requests
+        results = await asyncio.gather(
+            *(self.get_metadata(pdf['url'], self._session) for pdf in uncached_pdfs)
+        )
+        for pdf, metadata in zip(uncached_pdfs, results):
+            # A failed lookup or missing header keeps the cached filename rather than counting as a change
+            cached_pdf = previous_urls.get(pdf['url'], {})
+            filename = metadata.get('filename') or cached_pdf.get('filename')
+            if not filename and not metadata.get('failed'):
+                filename = self.filename_from_url(pdf['url'])
+            pdf['filename'] = filename
+
+        # Nothing to compare if the scrape matches the cache exactly
+        if current_pdfs == previous_pdfs:
+            logger.info("--- No new or modified documents found. ---")
+            self.adjust_interval(False)
+            return
 
         new_pdfs = []
         modified_pdfs = []
@@ -90,11 +326,9 @@ class ScraperCog(commands.Cog):
         for pdf in current_pdfs:
             if pdf['url'] in previous_urls:
                 previous_pdf = previous_urls[pdf['url']]
-                # Detect file changes based on filename or document ID (with same title)
-                if (
-                    pdf['filename'] != previous_pdf.get('filename') 
-                    or (pdf['document_id'] != previous_pdf.get('document_id') and pdf['title'] == previous_pdf.get('title'))
-                ):
+                # Detect file changes based on filename (the document ID is part of the URL)
+                previous_filename = self.normalize_filename(previous_pdf.get('filename'))
+                if previous_filename and pdf['filename'] != previous_filename:
                     modified_pdfs.append(pdf)
             elif pdf['title'] in previous_titles:
                 # Title match but new URL means likely modified document
@@ -102,38 +336,30 @@ class ScraperCog(commands.Cog):
             else:
                 new_pdfs.append(pdf)
         
-        CHANNEL_ID = int(os.getenv("CHANNEL_ID"))
-        ROLE_ID = int(os.getenv("ROLE_ID"))
-        if not CHANNEL_ID or not ROLE_ID:
-            logger.warning("CHANNEL_ID or ROLE_ID not set in env file. Skipping announcements.")
-            return
-
         # Announces any new or modified PDFs found
-        if new_pdfs or modified_pdfs:
-            channel = self.bot.get_channel(CHANNEL_ID)
-            if not channel:
-                return
-            
+        if not (new_pdfs or modified_pdfs):
+            logger.info("--- No new or modified documents found. ---")
+        else:
             if new_pdfs:
                 logger.info(f"--- Found {len(new_pdfs)} new documents in 'Ruleset and Resources': ---")
-                message_parts = []
-                message_parts.append(f"<@&{ROLE_ID}> **New FSAE Rules Posted:**\n")
-                for pdf in new_pdfs:
-                    message_parts.append(f"> **{pdf['title']}:**\n> {pdf['url']}")
-                await channel.send("\n".join(message_parts))
-                
             if modified_pdfs:
                 logger.info(f"--- Found {len(modified_pdfs)} modified documents in 'Ruleset and Resources': ---")
-                message_parts = []
-                message_parts.append(f"<@&{ROLE_ID}> **FSAE Rules Have Been Updated:**\n")
-                for pdf in modified_pdfs:
-                    message_parts.append(f"> **{pdf['title']}:** **(Updated)**\n> {pdf['url']}")
-                await channel.send("\n".join(message_parts))
-        else:
-            logger.info("--- No new or modified documents found. ---")
-        
+
+            if self._announce:
+                channel = self.get_channel()
+                if not channel:
+                    # Retries next check; not treated as a change so polling doesn't stay fast
+                    logger.warning(f"Announcement channel {self.channel_id} not found. Skipping announcements.")
+                    self.adjust_interval(False)
+                    return
+                await self.announce(channel, new_pdfs, modified_pdfs)
+
         # Saves the latest data for next comparison
-        self.save_data(current_pdfs)
+        await asyncio.to_thread(self.save_data, current_pdfs)
+        self._previous_pdfs = current_pdfs
+
+        # Only speeds up polling once the change has been handled
+        self.adjust_interval(bool(new_pdfs or modified_pdfs))
 
     @check_for_updates.before_loop
     async def before_check(self):
@@ -142,40 +368,111 @@ class ScraperCog(commands.Cog):
         await asyncio.sleep(5) # optional but recommended safety buffer
         logger.info("Bot is ready, starting the first scrape check.")
 
+    async def fetch_html(self):
+        """Fetch the raw server-rendered HTML of the documents page over the shared HTTP session."""
+        async with self._session.get(DOCUMENTS_URL) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    async def block_resources(self, route):
+        """Playwright route handler that aborts requests for resources the scraper doesn't need."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def render_html(self):
+        """
+        Render the documents page in a headless browser and return its HTML.
+        The browser is only launched the first time it is needed and is then kept alive.
+        """
+        if not self._browser:
+            playwright = await async_playwright().start()
+            try:
+                browser = await playwright.chromium.launch(headless=True)
+            except Exception:
+                # Stops the driver so a failed launch doesn't leave a process behind every check
+                await playwright.stop()
+                raise
+            self._playwright, self._browser = playwright, browser
+
+        # Uses a fresh context per scrape so cookies don't carry over between checks
+        context = await self._browser.new_context()
+        try:
+            page = await context.new_page()
+            # Only the document HTML is needed, so skips images, styles, fonts and media
+            await page.route("**/*", self.block_resources)
+            await page.goto(DOCUMENTS_URL, wait_until="domcontentloaded")
+            # The table may be filled in by scripts after DOMContentLoaded, so waits for the ruleset row
+            try:
+                await page.wait_for_selector(RULESET_ROW_SELECTOR, timeout=RENDER_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                logger.warning("Timed out waiting for the ruleset row to render")
+            return await page.content()
+        finally:
+            await context.close()
+
+    def parse_ruleset_rows(self, html):
+        """
+        Incrementally parse the page and return the rows under 'Ruleset and Resources',
+        or None if the folder isn't present or the page can't be parsed.
+        Parsing stops as soon as the next folder begins.
+        """
+        parser = etree.HTMLPullParser(events=("end",), tag="tr")
+        ruleset_parent = None
+        rows = []
+
+        def read_rows():
+            # Returns True once the next folder row is reached
+            nonlocal ruleset_parent
+            for _, row in parser.read_events():
+                if ruleset_parent is None:
+                    if row.get("data-folder-id") == "Ruleset and Resources":
+                        ruleset_parent = row.getparent()
+                elif row.getparent() is ruleset_parent:
+                    if "folder" in row.get("class", "").split():
+                        return True
+                    rows.append(row)
+            return False
+
+        try:
+            for start in range(0, len(html), PARSE_CHUNK_SIZE):
+                parser.feed(html[start:start + PARSE_CHUNK_SIZE])
+                if read_rows():
+                    return rows
+            parser.close()
+        except etree.XMLSyntaxError as e:
+            # e.g. an empty body, which lxml refuses to close
+            logger.warning(f"Could not parse documents page: {e}")
+            return None
+        read_rows()
+
+        return rows if ruleset_parent is not None else None
+
     async def scrape_pdfs(self):
         """Scrape the FSAE website for all PDFs listed under 'Ruleset and Resources'."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto("https://www.fsaeonline.com/cdsweb/gen/DocumentResources.aspx")
-            html = await page.content()
-            await browser.close()
-
-        soup = BeautifulSoup(html, "html.parser")
-        ruleset_row = soup.find("tr", {"data-folder-id": "Ruleset and Resources"})
-        if not ruleset_row:
+        try:
+            rows = self.parse_ruleset_rows(await self.fetch_html())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Plain request for documents page failed: {e}")
+            rows = None
+        if rows is None:
+            # Falls back to a rendered page if the request was refused or the table is built client-side
+            logger.info("Ruleset row not in raw HTML, rendering page with Playwright")
+            rows = self.parse_ruleset_rows(await self.render_html())
+        if rows is None:
             logger.warning("Ruleset row not found")
-            return
-        
-        # Collect all sibling rows until the next folder section
-        rows = []
-        for sibling in ruleset_row.find_next_siblings("tr"):
-            # Stops after hitting the next folder section
-            if "folder" in sibling.get("class", []):
-                break
-            rows.append(sibling)
+            return []
         
         links = []
         base_url = "https://www.fsaeonline.com"
 
         for row in rows:
             # Finds the document title (usually in the first cell)
-            first_cell = row.find("td")
-            main_title = first_cell.find(text=True, recursive=False).strip()
+            main_title = TITLE_XPATH(row).strip()
 
-            # Finds any description text
-            desc_tag = first_cell.find("span")
-            desc_text = desc_tag.get_text(strip=True) if desc_tag else ""
+            # Finds any description text, stripping and joining each text node like get_text(strip=True)
+            desc_text = "".join(text.strip() for text in DESCRIPTION_XPATH(row))
             
             # Creates the final title and adds any description text 
             final_title = main_title
@@ -183,18 +480,15 @@ class ScraperCog(commands.Cog):
                 final_title += f" ({desc_text})"
 
             # Find the download button specifically
-            download_tag = row.find("a", class_="btn btn-primary")
+            download_hrefs = DOWNLOAD_XPATH(row)
 
             # Checks that a valid download button was found
-            if download_tag and "href" in download_tag.attrs:
-                download_url = download_tag["href"]
+            if download_hrefs:
+                download_url = download_hrefs[0]
                 full_url = base_url + download_url
 
                 # Extracts DocumentID from URL if present
-                try:
-                    doc_id = full_url.split("DocumentID=")[1]
-                except IndexError:
-                    doc_id = None
+                doc_id = self.document_id_from_url(full_url)
                 
                 links.append({
                     "title": final_title, 